@@ -1,91 +1,287 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Any, Optional
 import json
-from ai_config import LLM_PROVIDER, LOCAL_LLM_URL, LOCAL_LLM_MODEL
+from ai_config import LLM_PROVIDER, LOCAL_LLM_URL, LOCAL_LLM_MODEL, MAX_INSIGHT_LENGTH
+
+# Shared session so Keep-Alive connections are reused across the many
+# per-sector insight calls instead of paying a TCP + TLS handshake each time.
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Resolve the provider once at import: when the configured provider's API key
+# is absent every call would fall back to static insights anyway, so skip the
+# per-call credential checks and dead dispatch work up front
+_EFFECTIVE_PROVIDER = LLM_PROVIDER
+if LLM_PROVIDER == "openai" and not os.getenv('OPENAI_API_KEY'):
+    _EFFECTIVE_PROVIDER = "enhanced_static"
+elif LLM_PROVIDER == "huggingface" and not os.getenv('HUGGINGFACE_API_KEY'):
+    _EFFECTIVE_PROVIDER = "enhanced_static"
+
+# Memoized insights keyed by provider, sector, rounded percentage and year so
+# Streamlit reruns with unchanged inputs skip the (slow, paid) LLM calls
+_INSIGHT_CACHE: Dict[Any, Any] = {}
+_INSIGHT_CACHE_MAX_ENTRIES = 1024
 
 
-def get_ai_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any]) -> str:
+def _sector_year(sector_data: Dict[str, Any]) -> int:
+    """Read the data year from the first sector entry without copying the dict."""
+    if sector_data:
+        return next(iter(sector_data.values())).get('year', 2023)
+    return 2023
+
+
+def get_ai_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any],
+                   year: Optional[int] = None) -> str:
     """
     Get AI-powered insight for a sector using the configured LLM provider.
-    
+
     Args:
         sector_name: Name of the sector
         percentage: Percentage contribution of the sector
         sector_data: Complete sector data for context
-        
+        year: Data year; computed from sector_data when not given
+
     Returns:
         str: AI-generated insight
     """
-    if LLM_PROVIDER == "openai":
-        return get_openai_insight(sector_name, percentage, sector_data)
-    elif LLM_PROVIDER == "huggingface":
-        return get_huggingface_insight(sector_name, percentage, sector_data)
-    elif LLM_PROVIDER == "local_llm":
-        return get_local_llm_insight(sector_name, percentage, sector_data)
+    if year is None:
+        year = _sector_year(sector_data)
+    cache_key = (_EFFECTIVE_PROVIDER, sector_name, round(percentage, 1), year)
+    cached = _INSIGHT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Unknown providers default to enhanced static insights
+    provider = _PROVIDER_DISPATCH.get(_EFFECTIVE_PROVIDER, get_enhanced_static_insight)
+    insight = provider(sector_name, percentage, sector_data, year)
+
+    if len(_INSIGHT_CACHE) < _INSIGHT_CACHE_MAX_ENTRIES:
+        _INSIGHT_CACHE[cache_key] = insight
+    return insight
+
+
+def get_ai_insights_bulk(sectors: Dict[str, float], sector_data: Dict[str, Any],
+                         year: Optional[int] = None) -> Dict[str, str]:
+    """
+    Get AI-powered insights for many sectors in a single LLM call.
+
+    Batches all sectors into one prompt so the network and model latency is
+    paid once instead of once per sector.
+
+    Args:
+        sectors: Mapping of display sector name to percentage contribution
+        sector_data: Complete sector data for context
+        year: Data year; computed from sector_data when not given
+
+    Returns:
+        dict: Mapping of display sector name to insight text
+    """
+    if year is None:
+        year = _sector_year(sector_data)
+    cache_key = (_EFFECTIVE_PROVIDER, tuple(sorted((name, round(pct, 1)) for name, pct in sectors.items())), year)
+    cached = _INSIGHT_CACHE.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    if _EFFECTIVE_PROVIDER == "openai":
+        bulk = get_openai_insights_bulk(sectors, sector_data, year)
+        if bulk is not None:
+            if len(_INSIGHT_CACHE) < _INSIGHT_CACHE_MAX_ENTRIES:
+                _INSIGHT_CACHE[cache_key] = dict(bulk)
+            return bulk
+    if _EFFECTIVE_PROVIDER in _PROVIDER_DISPATCH and sectors:
+        # Providers without a batch endpoint are still network-bound per
+        # sector; overlap the calls so wall time is ~max(RTT), not the sum
+        with ThreadPoolExecutor(max_workers=min(8, len(sectors))) as executor:
+            results = list(executor.map(
+                lambda item: get_ai_insight(item[0], item[1], sector_data, year),
+                sectors.items()
+            ))
+        return dict(zip(sectors.keys(), results))
+    # Static path is local and cheap, so plain per-sector calls suffice
+    return {name: get_ai_insight(name, pct, sector_data, year) for name, pct in sectors.items()}
+
+
+def get_openai_insights_bulk(sectors: Dict[str, float], sector_data: Dict[str, Any],
+                             year: Optional[int] = None) -> Optional[Dict[str, str]]:
+    """
+    Get insights for all sectors with one OpenAI call returning JSON.
+    Returns None when the API key is missing or the call fails.
+    """
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        return None
+
+    if year is None:
+        year = _sector_year(sector_data)
+    sector_lines = {name: f"{pct:.1f}% of GDP" for name, pct in sectors.items()}
+
+    prompt = f"""
+    Analyze India's GDP sectors for {year}.
+
+    Sectors: {json.dumps(sector_lines)}
+
+    For each sector, provide a brief, insightful analysis (1-2 sentences) of its
+    current performance, development stage, and economic implications for India.
+    Return a JSON object mapping each sector name to its insight.
+    """
+
+    try:
+        response = _SESSION.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": "gpt-3.5-turbo",
+                "messages": [{"role": "user", "content": prompt}],
+                "response_format": {"type": "json_object"},
+                "max_tokens": 1000,
+                "temperature": 0.7
+            },
+            timeout=(3, 10)
+        )
+
+        if response.status_code == 200:
+            result = response.json()
+            insights = json.loads(result['choices'][0]['message']['content'])
+            # Fill any sectors the model skipped with static insights
+            return {
+                name: insights.get(name, get_enhanced_static_insight(name, pct, sector_data)).strip()
+                for name, pct in sectors.items()
+            }
+        return None
+
+    except Exception as e:
+        print(f"OpenAI API error: {e}")
+        return None
+
+
+# Static insight templates, built once at import so the per-call work is one
+# percentage format plus a single .format on a shared constant
+_TEMPLATES = {
+    'agriculture_high': "High agriculture dependence ({pct}%) - typical of developing economies with strong rural employment.",
+    'agriculture_low': "Low agriculture share ({pct}%) - India has successfully transitioned to industrialization and services.",
+    'agriculture_moderate': "Moderate agriculture ({pct}%) - balanced sector typical of emerging economies.",
+    'manufacturing_gap': "Manufacturing gap ({pct}%) - below 25% target for economic development and job creation.",
+    'manufacturing_strong': "Strong manufacturing ({pct}%) - well-developed and competitive sector driving exports.",
+    'manufacturing_growing': "Growing manufacturing ({pct}%) - shows positive development trends and industrialization.",
+    'construction': "Infrastructure development ({pct}%) - shows {strength} construction activity and urbanization.",
+    'mining': "Resource extraction ({pct}%) - essential for industrial inputs and energy production.",
+    'utilities': "Critical infrastructure ({pct}%) - power and water supply essential for economic growth.",
+    'trade_hotels': "Domestic consumption ({pct}%) - key driver of tourism and retail services.",
+    'financial_services': "Financial markets ({pct}%) - shows {strength} financial sector development and capital access.",
+    'real_estate': "Urban development ({pct}%) - important for investment and housing market growth.",
+    'public_admin': "Government services ({pct}%) - public sector employment and administrative support.",
+    'other_services': "Diverse services ({pct}%) - includes IT, education, healthcare, and emerging sectors.",
+    'default': "{sector_name} sector ({pct}%) - contributes to economic diversification and growth.",
+}
+
+
+def _agriculture_insight(percentage: float, sector_name: str) -> str:
+    pct = format(percentage, '.1f')
+    if percentage > 25:
+        return _TEMPLATES['agriculture_high'].format(pct=pct)
+    elif percentage < 10:
+        return _TEMPLATES['agriculture_low'].format(pct=pct)
     else:
-        # Default to enhanced static insights
-        return get_enhanced_static_insight(sector_name, percentage, sector_data)
+        return _TEMPLATES['agriculture_moderate'].format(pct=pct)
+
+
+def _manufacturing_insight(percentage: float, sector_name: str) -> str:
+    pct = format(percentage, '.1f')
+    if percentage < 15:
+        return _TEMPLATES['manufacturing_gap'].format(pct=pct)
+    elif percentage > 25:
+        return _TEMPLATES['manufacturing_strong'].format(pct=pct)
+    else:
+        return _TEMPLATES['manufacturing_growing'].format(pct=pct)
+
+
+def _construction_insight(percentage: float, sector_name: str) -> str:
+    strength = "strong" if percentage > 7 else "moderate"
+    return _TEMPLATES['construction'].format(pct=format(percentage, '.1f'), strength=strength)
+
+
+def _mining_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['mining'].format(pct=format(percentage, '.1f'))
+
+
+def _utilities_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['utilities'].format(pct=format(percentage, '.1f'))
+
+
+def _trade_hotels_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['trade_hotels'].format(pct=format(percentage, '.1f'))
+
 
+def _financial_services_insight(percentage: float, sector_name: str) -> str:
+    strength = "strong" if percentage > 7 else "moderate"
+    return _TEMPLATES['financial_services'].format(pct=format(percentage, '.1f'), strength=strength)
 
-def get_enhanced_static_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any]) -> str:
+
+def _real_estate_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['real_estate'].format(pct=format(percentage, '.1f'))
+
+
+def _public_admin_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['public_admin'].format(pct=format(percentage, '.1f'))
+
+
+def _other_services_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['other_services'].format(pct=format(percentage, '.1f'))
+
+
+def _default_insight(percentage: float, sector_name: str) -> str:
+    return _TEMPLATES['default'].format(pct=format(percentage, '.1f'), sector_name=sector_name)
+
+
+# O(1) dispatch instead of an elif chain of string comparisons per call
+_SECTOR_HANDLERS: Dict[str, Callable[[float, str], str]] = {
+    'agriculture': _agriculture_insight,
+    'manufacturing': _manufacturing_insight,
+    'construction': _construction_insight,
+    'mining': _mining_insight,
+    'utilities': _utilities_insight,
+    'trade_hotels': _trade_hotels_insight,
+    'financial_services': _financial_services_insight,
+    'real_estate': _real_estate_insight,
+    'public_admin': _public_admin_insight,
+    'other_services': _other_services_insight,
+}
+
+
+# Known display names mapped to handler keys up front, so the common path is
+# one dict hit instead of two string allocations per call
+_SECTOR_KEY_MAP: Dict[str, str] = {
+    key.replace('_', ' ').title(): key for key in _SECTOR_HANDLERS
+}
+
+
+def get_enhanced_static_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any],
+                                year: Optional[int] = None) -> str:
     """
     Enhanced static insights with more contextual analysis.
     This provides dynamic insights based on sector performance and context.
     """
-    sector_lower = sector_name.lower().replace(' ', '_')
-    
-    # Get overall context
-    year = list(sector_data.values())[0].get('year', 2023) if sector_data else 2023
-    
-    # Get sector-specific insights with dynamic context
-    if sector_lower == 'agriculture':
-        if percentage > 25:
-            return f"High agriculture dependence ({percentage:.1f}%) - typical of developing economies with strong rural employment."
-        elif percentage < 10:
-            return f"Low agriculture share ({percentage:.1f}%) - India has successfully transitioned to industrialization and services."
-        else:
-            return f"Moderate agriculture ({percentage:.1f}%) - balanced sector typical of emerging economies."
-    
-    elif sector_lower == 'manufacturing':
-        if percentage < 15:
-            return f"Manufacturing gap ({percentage:.1f}%) - below 25% target for economic development and job creation."
-        elif percentage > 25:
-            return f"Strong manufacturing ({percentage:.1f}%) - well-developed and competitive sector driving exports."
-        else:
-            return f"Growing manufacturing ({percentage:.1f}%) - shows positive development trends and industrialization."
-    
-    elif sector_lower == 'construction':
-        strength = "strong" if percentage > 7 else "moderate"
-        return f"Infrastructure development ({percentage:.1f}%) - shows {strength} construction activity and urbanization."
-    
-    elif sector_lower == 'mining':
-        return f"Resource extraction ({percentage:.1f}%) - essential for industrial inputs and energy production."
-    
-    elif sector_lower == 'utilities':
-        return f"Critical infrastructure ({percentage:.1f}%) - power and water supply essential for economic growth."
-    
-    elif sector_lower == 'trade_hotels':
-        return f"Domestic consumption ({percentage:.1f}%) - key driver of tourism and retail services."
-    
-    elif sector_lower == 'financial_services':
-        strength = "strong" if percentage > 7 else "moderate"
-        return f"Financial markets ({percentage:.1f}%) - shows {strength} financial sector development and capital access."
-    
-    elif sector_lower == 'real_estate':
-        return f"Urban development ({percentage:.1f}%) - important for investment and housing market growth."
-    
-    elif sector_lower == 'public_admin':
-        return f"Government services ({percentage:.1f}%) - public sector employment and administrative support."
-    
-    elif sector_lower == 'other_services':
-        return f"Diverse services ({percentage:.1f}%) - includes IT, education, healthcare, and emerging sectors."
-    
-    else:
-        return f"{sector_name} sector ({percentage:.1f}%) - contributes to economic diversification and growth."
+    sector_lower = _SECTOR_KEY_MAP.get(sector_name) or sector_name.lower().replace(' ', '_')
+    return _SECTOR_HANDLERS.get(sector_lower, _default_insight)(percentage, sector_name)
 
 
-def get_openai_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any]) -> str:
+def get_openai_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any],
+                       year: Optional[int] = None) -> str:
     """
     Get insight using OpenAI GPT API.
     Requires OPENAI_API_KEY environment variable.
@@ -93,14 +289,22 @@ def get_openai_insight(sector_name: str, percentage: float, sector_data: Dict[st
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         return get_enhanced_static_insight(sector_name, percentage, sector_data)
-    
+
+    if year is None:
+        year = _sector_year(sector_data)
+    # Keep the prompt compact: serializing the whole sector dict per call made
+    # total tokens quadratic in the sector count for no extra signal
+    top_sectors = ", ".join(
+        f"{k}:{v.get('percentage', 0):.1f}%"
+        for k, v in sorted(sector_data.items(), key=lambda kv: -kv[1].get('percentage', 0))[:3]
+    )
     prompt = f"""
     Analyze India's {sector_name} sector which contributes {percentage:.1f}% to GDP.
-    
+
     Context:
-    - Year: {list(sector_data.values())[0].get('year', 2023)}
+    - Year: {year}
     - Total sectors: {len(sector_data)}
-    - Sector data: {json.dumps(sector_data, indent=2)}
+    - Top sectors: {top_sectors}
     
     Provide a brief, insightful analysis (1-2 sentences) about this sector's:
     1. Current performance and significance
@@ -111,7 +315,7 @@ def get_openai_insight(sector_name: str, percentage: float, sector_data: Dict[st
     """
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -120,10 +324,10 @@ def get_openai_insight(sector_name: str, percentage: float, sector_data: Dict[st
             json={
                 "model": "gpt-3.5-turbo",
                 "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 150,
+                "max_tokens": 60,
                 "temperature": 0.7
             },
-            timeout=10
+            timeout=(3, 10)
         )
         
         if response.status_code == 200:
@@ -137,7 +341,8 @@ def get_openai_insight(sector_name: str, percentage: float, sector_data: Dict[st
         return get_enhanced_static_insight(sector_name, percentage, sector_data)
 
 
-def get_huggingface_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any]) -> str:
+def get_huggingface_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any],
+                            year: Optional[int] = None) -> str:
     """
     Get insight using Hugging Face API.
     Requires HUGGINGFACE_API_KEY environment variable.
@@ -145,15 +350,17 @@ def get_huggingface_insight(sector_name: str, percentage: float, sector_data: Di
     api_key = os.getenv('HUGGINGFACE_API_KEY')
     if not api_key:
         return get_enhanced_static_insight(sector_name, percentage, sector_data)
-    
-    prompt = f"Analyze India's {sector_name} sector ({percentage:.1f}% of GDP) in {list(sector_data.values())[0].get('year', 2023)}. Provide brief economic insight:"
+
+    if year is None:
+        year = _sector_year(sector_data)
+    prompt = f"Analyze India's {sector_name} sector ({percentage:.1f}% of GDP) in {year}. Provide brief economic insight:"
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api-inference.huggingface.co/models/gpt2",
             headers={"Authorization": f"Bearer {api_key}"},
             json={"inputs": prompt},
-            timeout=10
+            timeout=(3, 10)
         )
         
         if response.status_code == 200:
@@ -167,34 +374,60 @@ def get_huggingface_insight(sector_name: str, percentage: float, sector_data: Di
         return get_enhanced_static_insight(sector_name, percentage, sector_data)
 
 
-def get_local_llm_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any]) -> str:
+def get_local_llm_insight(sector_name: str, percentage: float, sector_data: Dict[str, Any],
+                          year: Optional[int] = None) -> str:
     """
     Get insight using local LLM (e.g., Ollama).
     Requires Ollama to be running locally.
     """
+    if year is None:
+        year = _sector_year(sector_data)
     prompt = f"""
-    Analyze India's {sector_name} sector which contributes {percentage:.1f}% to GDP in {list(sector_data.values())[0].get('year', 2023)}.
+    Analyze India's {sector_name} sector which contributes {percentage:.1f}% to GDP in {year}.
     
     Provide a brief, insightful economic analysis (1-2 sentences) about this sector's performance and significance for India's economy.
     """
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             LOCAL_LLM_URL,
             json={
                 "model": LOCAL_LLM_MODEL,
                 "prompt": prompt,
-                "stream": False
+                "stream": True
             },
-            timeout=10
+            timeout=(3, 10),
+            stream=True
         )
-        
+
         if response.status_code == 200:
-            result = response.json()
-            return result['response'].strip()
+            # Consume tokens as they arrive and stop as soon as we have a
+            # couple of sentences or hit the display cap, instead of waiting
+            # for the model to finish generating text we would never show
+            buffer = ""
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                buffer += chunk.get('response', '')
+                if chunk.get('done'):
+                    break
+                if len(buffer) >= MAX_INSIGHT_LENGTH or buffer.count('. ') >= 2:
+                    break
+            response.close()
+            return buffer.strip()
         else:
             return get_enhanced_static_insight(sector_name, percentage, sector_data)
-            
+
     except Exception as e:
         print(f"Local LLM error: {e}")
-        return get_enhanced_static_insight(sector_name, percentage, sector_data) 
\ No newline at end of file
+        return get_enhanced_static_insight(sector_name, percentage, sector_data)
+
+
+# Provider dispatch table used by get_ai_insight (defined last so the
+# provider helpers above are already bound)
+_PROVIDER_DISPATCH: Dict[str, Callable[[str, float, Dict[str, Any]], str]] = {
+    "openai": get_openai_insight,
+    "huggingface": get_huggingface_insight,
+    "local_llm": get_local_llm_insight,
+}
\ No newline at end of file
@@ -1,17 +1,115 @@
+import os
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import requests
 
-from utils import (calculate_required_growth, fetch_india_dependency_ratio,
-                   fetch_india_median_age, fetch_india_population,
-                   fetch_india_sector_gdp, fetch_latest_gdp_growth,
-                   get_india_gdp_usd, project_median_age_evidence_based,
-                   project_population, fetch_sector_growth_projections,
-                   get_sector_growth_insights, fetch_country_sector_gdp,
-                   get_country_code, get_capital_city)
-from plotting_utils import create_sector_sunburst_chart, get_sector_data, create_projected_sector_pie_chart, create_comparison_country_pie_chart
+from utils import (calculate_required_growth, fetch_all_india_stats,
+                   fetch_india_sector_gdp, get_india_gdp_usd,
+                   project_median_age_evidence_based,
+                   project_population, get_sector_growth_insights,
+                   fetch_country_sector_gdp, get_country_code,
+                   get_capital_city)
+
+@st.cache_resource
+def load_per_capita_df() -> pd.DataFrame:
+    """Load the per-capita GDP table once, shared across sessions.
+
+    cache_resource hands every session the same DataFrame object instead of
+    the per-session copies cache_data would make — nothing in this app
+    mutates the table, so treat the result as read-only.
+
+    Prefers the pre-cleaned Parquet file written by prepare_percap_parquet.py
+    (typed columns, no string parsing); falls back to cleaning the raw CSV
+    with plain substring replaces and one pd.to_numeric parse pass, with
+    malformed cells coerced to NaN and dropped.
+    """
+    if os.path.exists("gdp_per_capita_2025.parquet"):
+        return pd.read_parquet("gdp_per_capita_2025.parquet")
+    df = pd.read_csv("gdp-per-capita-by-country-2025.csv")
+    df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"] = pd.to_numeric(
+        df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"]
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False),
+        errors="coerce",
+    )
+    df = df.dropna(subset=["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"])
+    # float32 is plenty of precision for a lookup table and halves the
+    # working set; country names are low-cardinality labels
+    df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"] = df[
+        "GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"
+    ].astype("float32")
+    df["country"] = df["country"].astype("category")
+    return df
+
+
+# Cached shims around the utils fetchers and projection helpers so widget
+# changes don't re-trigger World Bank HTTP calls or redundant recomputation
+@st.cache_data(ttl=86400, show_spinner=False)
+def _cached_gdp_usd():
+    return get_india_gdp_usd()
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _prefetch_india_stats(target_year):
+    """Memoize the concurrent World Bank prefetch for a day per target year."""
+    return fetch_all_india_stats(target_year)
+
+
+@st.cache_data(ttl=3600)
+def _cached_sunburst_chart():
+    """Build the sector sunburst once; it depends on no user input."""
+    # Imported here (not at module top) so reruns that never reach the chart
+    # sections — empty inputs, validation errors — skip the Plotly import
+    from plotting_utils import create_sector_sunburst_chart
+
+    return create_sector_sunburst_chart()
+
+
+@st.cache_data
+def _cached_projected_pie(projections_items, target_year):
+    """Memoize the projected-pie figure on a hashable projections key.
+
+    Rebuilding the Plotly figure is the expensive part; keying on the
+    flattened projections lets unrelated widget edits reuse it.
+    """
+    from plotting_utils import create_projected_sector_pie_chart
+
+    projections = {sector: dict(data) for sector, data in projections_items}
+    return create_projected_sector_pie_chart(projections, target_year)
+
+
+@st.cache_data
+def _cached_project_population(base_pop, base_year, target_year):
+    return project_population(base_pop, base_year, target_year)
+
+
+@st.cache_data
+def _cached_project_median_age(current_age, base_year, target_year):
+    return project_median_age_evidence_based(current_age, base_year, target_year)
+
+
+# Shared metric HTML, built once at import instead of re-assembled from
+# f-string pieces on every rerun
+_METRIC_TPL = (
+    "<b>{label}</b>"
+    "<div style='font-size:{size}; font-weight:bold; color:{color}; margin-bottom:16px;'>{value}</div>"
+)
+
+
+def metric_block(label, value, color, size="1.5em"):
+    """Build a label + value pair as one HTML fragment.
+
+    Coalescing the pair into a single st.markdown call halves the number of
+    deltas Streamlit ships to the frontend per rerun; the bottom margin
+    replaces the separate <br/> spacer calls.
+    """
+    return _METRIC_TPL.format(label=label, value=value, color=color, size=size)
+
 
 st.title("Required GDP Growth Calculator")
 
@@ -21,71 +119,91 @@ This app calculates the per annum growth required to reach India's target GDP va
 """
 )
 
-current_gdp = get_india_gdp_usd()
+current_gdp = _cached_gdp_usd()
 
-# Accept current and target GDP in billion dollars for user input
-current_billion = st.number_input(
-    "Current GDP of India (Billion $)",
-    min_value=0.0,
-    value=current_gdp / 1e9,
-    step=500.0,
-    format="%.2f",
-)
-target_billion = st.number_input(
-    "Target GDP of India (Billion $)", min_value=0.0, value=30000.0, step=500.0, format="%.2f"
-)
+current_year = datetime.now().year
+
+# Accept current and target GDP in billion dollars for user input; the form
+# batches edits so the heavy downstream work runs once per explicit submit
+# instead of on every keystroke
+with st.form("inputs"):
+    current_billion = st.number_input(
+        "Current GDP of India (Billion $)",
+        min_value=0.0,
+        value=current_gdp / 1e9,
+        step=500.0,
+        format="%.2f",
+    )
+    target_billion = st.number_input(
+        "Target GDP of India (Billion $)", min_value=0.0, value=30000.0, step=500.0, format="%.2f"
+    )
+    target_year = st.number_input("Target year", min_value=current_year + 1, value=2047, step=1)
+    submitted = st.form_submit_button("Calculate")
 
 # Convert back to raw numbers for calculation
 current = current_billion * 1e9
 target = target_billion * 1e9
-
-current_year = datetime.now().year
-target_year = st.number_input("Target year", min_value=current_year + 1, value=2047, step=1)
 time = target_year - current_year
 
-if current > 0 and target > 0 and time > 0:
+# Remember that a calculation ran so the results survive reruns that aren't
+# form submits (the heavy work behind them is cached, so redraws are cheap)
+if submitted:
+    st.session_state["calculated"] = True
+show_results = submitted or st.session_state.get("calculated", False)
+
+if show_results and current > 0 and target > 0 and time > 0:
     try:
         growth = calculate_required_growth(current, target, time)
 
-        # Fetch latest GDP growth rate of India
-        latest_growth, latest_year = fetch_latest_gdp_growth()
+        # Paint the pure-math KPI immediately — it needs no network — and
+        # leave a placeholder for the World Bank-backed column so the page
+        # isn't blank while the fetches run
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("<b>Required Per Annum Growth (%)</b>", unsafe_allow_html=True)
             if growth is not None:
                 st.markdown(
-                    f"<span style='font-size:2em;'><b>{growth:.2f}%</b></span>", unsafe_allow_html=True
-                )
-            else:
-                st.markdown(
-                    f"<span style='font-size:2em; color:red;'><b>Error</b></span>", unsafe_allow_html=True
-                )
-        with col2:
-            if latest_growth is not None and growth is not None:
-                color = "green" if latest_growth >= growth else "red"
-                st.markdown(
-                    f"<b>Latest GDP Growth Rate ({latest_year})</b>", unsafe_allow_html=True
-                )
-                st.markdown(
-                    f"<span style='font-size:2em; color:{color};'><b>{latest_growth:.2f}%</b></span>",
+                    f"<b>Required Per Annum Growth (%)</b><br/><span style='font-size:2em;'><b>{growth:.2f}%</b></span>",
                     unsafe_allow_html=True,
                 )
             else:
-                st.markdown("<b>Latest GDP Growth Rate</b>", unsafe_allow_html=True)
                 st.markdown(
-                    f"<span style='font-size:2em; color:gray;'><b>N/A</b></span>",
+                    "<b>Required Per Annum Growth (%)</b><br/><span style='font-size:2em; color:red;'><b>Error</b></span>",
                     unsafe_allow_html=True,
                 )
+        latest_growth_ph = col2.empty()
+
+        # Kick off all independent World Bank fetches in parallel up front.
+        # Keep the last good result in session_state so a failed refresh
+        # (cache expiry + API hiccup) shows stale numbers instead of N/As.
+        india_stats = _prefetch_india_stats(target_year)
+        if india_stats["growth"][0] is not None:
+            st.session_state["last_india_stats"] = india_stats
+        elif "last_india_stats" in st.session_state:
+            india_stats = st.session_state["last_india_stats"]
+
+        # Fetch latest GDP growth rate of India
+        latest_growth, latest_year = india_stats["growth"]
+        if latest_growth is not None and growth is not None:
+            color = "green" if latest_growth >= growth else "red"
+            latest_growth_ph.markdown(
+                f"<b>Latest GDP Growth Rate ({latest_year})</b><br/><span style='font-size:2em; color:{color};'><b>{latest_growth:.2f}%</b></span>",
+                unsafe_allow_html=True,
+            )
+        else:
+            latest_growth_ph.markdown(
+                "<b>Latest GDP Growth Rate</b><br/><span style='font-size:2em; color:gray;'><b>N/A</b></span>",
+                unsafe_allow_html=True,
+            )
 
         # --- Per Capita GDP Comparison Section ---
         st.markdown("---")
         st.header(":money_with_wings: Per Capita GDP Comparison")
 
         # Fetch India's population (latest) from World Bank
-        india_pop, india_pop_year = fetch_india_population()
+        india_pop, india_pop_year = india_stats["population"]
         projected_pop = None
         if india_pop and india_pop_year and target_year > india_pop_year:
-            projected_pop = project_population(india_pop, india_pop_year, target_year)
+            projected_pop = _cached_project_population(india_pop, india_pop_year, target_year)
 
         if india_pop:
             current_per_capita = current / india_pop
@@ -96,49 +214,44 @@ if current > 0 and target > 0 and time > 0:
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown(
-                    f"<b>Current Per Capita GDP (India, {india_pop_year}):</b>",
-                    unsafe_allow_html=True,
-                )
-                st.markdown(
-                    f"<div style='font-size:2.5em; font-weight:bold; color:#1f77b4;'>$ {current_per_capita:,.2f}</div>",
+                    metric_block(f"Current Per Capita GDP (India, {india_pop_year}):", f"$ {current_per_capita:,.2f}", "#1f77b4", size="2.5em"),
                     unsafe_allow_html=True,
                 )
             with col2:
                 st.markdown(
-                    f"<b>Projected Per Capita GDP (India, {target_year}):</b>",
-                    unsafe_allow_html=True,
-                )
-                st.markdown(
-                    f"<div style='font-size:2.5em; font-weight:bold; color:#2ca02c;'>$ {projected_per_capita:,.2f}</div>",
+                    metric_block(f"Projected Per Capita GDP (India, {target_year}):", f"$ {projected_per_capita:,.2f}", "#2ca02c", size="2.5em"),
                     unsafe_allow_html=True,
                 )
 
             # Use local CSV for per capita GDP comparison
             try:
-                df = pd.read_csv("gdp-per-capita-by-country-2025.csv")
-                df = df.dropna(subset=["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"])
-                df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"] = (
-                    df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"]
-                    .replace("[\$,]", "", regex=True)
-                    .astype(float)
-                )
-                closest_5 = df.iloc[
-                    (df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"] - projected_per_capita)
-                    .abs()
-                    .argsort()[:5]
-                ]
+                df = load_per_capita_df()
+                # Partial selection (O(N)) instead of a full argsort just to pick 5
+                per_capita_arr = df["GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"].to_numpy()
+                # Cast the scalar too so the diff stays in float32
+                diffs = np.abs(per_capita_arr - per_capita_arr.dtype.type(projected_per_capita))
+                idx = np.argpartition(diffs, 5)[:5]
+                closest_5 = df.iloc[idx[np.argsort(diffs[idx])]]
                 st.markdown(
                     f"<br/><b>Countries with current GDP per capita closest to India's projected GDP per capita in {target_year}:</b>",
                     unsafe_allow_html=True,
                 )
-                country_links = []
-                for _, row in closest_5.iterrows():
-                    country_name = row['country']
-                    city = get_capital_city(country_name)
-                    youtube_url = f"https://www.youtube.com/results?search_query={city.replace(' ', '+')}+city+tour"
-                    link = f"<b><a href='{youtube_url}' target='_blank' style='color:inherit;text-decoration:underline'>{country_name}</a></b>: <span style='font-size:1.3em; color:#ff7f0e;'>$ {row['GDPPerCapita_GDPPerCapitaViaIMF_usd_2025']:,.2f}</span>"
-                    country_links.append(f"<li>{link}</li>")
-                st.markdown("<ul style='font-size:1.2em;'>" + "\n".join(country_links) + "</ul>", unsafe_allow_html=True)
+                # Fetch the five capital-city lookups concurrently so the
+                # section waits ~one network round-trip instead of five
+                country_names = closest_5['country'].tolist()
+                per_capita_values = closest_5['GDPPerCapita_GDPPerCapitaViaIMF_usd_2025'].tolist()
+                with ThreadPoolExecutor(max_workers=5) as executor:
+                    cities = list(executor.map(get_capital_city, country_names))
+                # One joined HTML string and one st.markdown call for the whole
+                # list; quote_plus handles multi-word capitals correctly
+                html = "<ul style='font-size:1.2em;'>" + "".join(
+                    f"<li><b><a href='https://www.youtube.com/results?search_query="
+                    f"{urllib.parse.quote_plus(city + ' city tour')}' target='_blank' "
+                    f"style='color:inherit;text-decoration:underline'>{country_name}</a></b>: "
+                    f"<span style='font-size:1.3em; color:#ff7f0e;'>$ {per_capita:,.2f}</span></li>"
+                    for country_name, city, per_capita in zip(country_names, cities, per_capita_values)
+                ) + "</ul>"
+                st.markdown(html, unsafe_allow_html=True)
             except Exception as e:
                 st.warning(f"Could not read per capita GDP CSV: {e}")
         else:
@@ -148,24 +261,30 @@ if current > 0 and target > 0 and time > 0:
         st.markdown("---")
         st.header(":factory: Sector-wise GDP Analysis")
         
-        # Current sector distribution (sunburst chart)
-        fig_current = create_sector_sunburst_chart()
+        # Build both figures first (data is already prefetched), then emit
+        # them back-to-back so the charts appear together instead of the
+        # page pausing between renders
+        fig_current = _cached_sunburst_chart()
+        projections = india_stats["projections"]
+        if projections:
+            projections_key = tuple(
+                (sector, tuple(sorted(data.items()))) for sector, data in sorted(projections.items())
+            )
+            fig_projected = _cached_projected_pie(projections_key, target_year)
+        else:
+            fig_projected = None
+
         if fig_current:
             st.plotly_chart(fig_current, use_container_width=True)
         else:
             st.warning("Could not fetch current sector data.")
-        
+
         st.markdown("<div style='height: 16px;'></div>", unsafe_allow_html=True)  # Small vertical gap
-        
-        # Projected sector distribution (pie chart)
-        with st.spinner("Fetching sector growth projections..."):
-            projections = fetch_sector_growth_projections(target_year)
-        if projections:
-            fig_projected = create_projected_sector_pie_chart(projections, target_year)
-            if fig_projected:
-                st.plotly_chart(fig_projected, use_container_width=True)
-            else:
-                st.warning("Could not create projected sector chart.")
+
+        if fig_projected:
+            st.plotly_chart(fig_projected, use_container_width=True)
+        elif projections:
+            st.warning("Could not create projected sector chart.")
         else:
             st.warning("Could not fetch sector growth projections.")
         
@@ -175,49 +294,35 @@ if current > 0 and target > 0 and time > 0:
             st.header(":busts_in_silhouette: Demographic Information")
             
             # Fetch demographic data
-            median_age, median_age_year = fetch_india_median_age()
-            dependency_ratio, dep_ratio_year = fetch_india_dependency_ratio()
+            median_age, median_age_year = india_stats["median_age"]
+            dependency_ratio, dep_ratio_year = india_stats["dependency_ratio"]
             
             # Current demographic information
-            st.markdown("<br/>", unsafe_allow_html=True)
             st.subheader(":calendar: Current Demographics")
-            st.markdown("<br/>", unsafe_allow_html=True)
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.markdown(f"<b>Population ({india_pop_year}):</b>", unsafe_allow_html=True)
                 st.markdown(
-                    f"<div style='font-size:1.5em; font-weight:bold; color:#1f77b4;'>{india_pop:,.0f}</div>",
+                    metric_block(f"Population ({india_pop_year}):", f"{india_pop:,.0f}", "#1f77b4"),
                     unsafe_allow_html=True,
                 )
             with col2:
                 if median_age:
-                    st.markdown(f"<b>Median Age ({median_age_year}):</b>", unsafe_allow_html=True)
                     st.markdown(
-                        f"<div style='font-size:1.5em; font-weight:bold; color:#ff7f0e;'>{median_age:.1f} years</div>",
+                        metric_block(f"Median Age ({median_age_year}):", f"{median_age:.1f} years", "#ff7f0e"),
                         unsafe_allow_html=True,
                     )
                 else:
-                    st.markdown("<b>Median Age:</b>", unsafe_allow_html=True)
-                    st.markdown(
-                        f"<div style='font-size:1.5em; font-weight:bold; color:gray;'>N/A</div>",
-                        unsafe_allow_html=True,
-                    )
+                    st.markdown(metric_block("Median Age:", "N/A", "gray"), unsafe_allow_html=True)
             with col3:
                 if dependency_ratio:
-                    st.markdown(f"<b>Dependency Ratio ({dep_ratio_year}):</b>", unsafe_allow_html=True)
                     st.markdown(
-                        f"<div style='font-size:1.5em; font-weight:bold; color:#9467bd;'>{dependency_ratio:.1f}%</div>",
+                        metric_block(f"Dependency Ratio ({dep_ratio_year}):", f"{dependency_ratio:.1f}%", "#9467bd"),
                         unsafe_allow_html=True,
                     )
                 else:
-                    st.markdown("<b>Dependency Ratio:</b>", unsafe_allow_html=True)
-                    st.markdown(
-                        f"<div style='font-size:1.5em; font-weight:bold; color:gray;'>N/A</div>",
-                        unsafe_allow_html=True,
-                    )
-            
+                    st.markdown(metric_block("Dependency Ratio:", "N/A", "gray"), unsafe_allow_html=True)
+
             # Population category and dependency level
-            st.markdown("<br/>", unsafe_allow_html=True)
             if median_age or dependency_ratio:
                 col1, col2 = st.columns(2)
                 with col1:
@@ -232,18 +337,13 @@ if current > 0 and target > 0 and time > 0:
                         else:
                             age_category = "Aging Population"
                             category_color = "#d62728"
-                        
-                        st.markdown("<b>Population Category:</b>", unsafe_allow_html=True)
+
                         st.markdown(
-                            f"<div style='font-size:1.5em; font-weight:bold; color:{category_color};'>{age_category}</div>",
+                            metric_block("Population Category:", age_category, category_color),
                             unsafe_allow_html=True,
                         )
                     else:
-                        st.markdown("<b>Population Category:</b>", unsafe_allow_html=True)
-                        st.markdown(
-                            f"<div style='font-size:1.5em; font-weight:bold; color:gray;'>N/A</div>",
-                            unsafe_allow_html=True,
-                        )
+                        st.markdown(metric_block("Population Category:", "N/A", "gray"), unsafe_allow_html=True)
                 with col2:
                     if dependency_ratio:
                         # Interpret dependency ratio
@@ -256,57 +356,45 @@ if current > 0 and target > 0 and time > 0:
                         else:
                             dep_category = "High Dependency"
                             dep_color = "#d62728"
-                        
-                        st.markdown("<b>Dependency Level:</b>", unsafe_allow_html=True)
-                        st.markdown(
-                            f"<div style='font-size:1.5em; font-weight:bold; color:{dep_color};'>{dep_category}</div>",
-                            unsafe_allow_html=True,
-                        )
-            
 
-                    else:
-                        st.markdown("<b>Dependency Level:</b>", unsafe_allow_html=True)
                         st.markdown(
-                            f"<div style='font-size:1.5em; font-weight:bold; color:gray;'>N/A</div>",
+                            metric_block("Dependency Level:", dep_category, dep_color),
                             unsafe_allow_html=True,
                         )
-            
+                    else:
+                        st.markdown(metric_block("Dependency Level:", "N/A", "gray"), unsafe_allow_html=True)
+
             # Projected demographic information
-            st.markdown("<br/>", unsafe_allow_html=True)
             st.markdown("---")
-            st.markdown("<br/>", unsafe_allow_html=True)
             st.subheader(":chart_with_upwards_trend: Projected Demographics")
-            st.markdown("<br/>", unsafe_allow_html=True)
             
             # Calculate projected median age if current age is available
             projected_median_age = None
             if median_age and median_age_year:
-                projected_median_age = project_median_age_evidence_based(median_age, median_age_year, target_year)
+                projected_median_age = _cached_project_median_age(median_age, median_age_year, target_year)
             
             col1, col2 = st.columns(2)
             with col1:
-                st.markdown(f"<b>Projected Population ({target_year}):</b>", unsafe_allow_html=True)
                 st.markdown(
-                    f"<div style='font-size:1.5em; font-weight:bold; color:#2ca02c;'>{projected_pop:,.0f}</div>",
+                    metric_block(f"Projected Population ({target_year}):", f"{projected_pop:,.0f}", "#2ca02c"),
                     unsafe_allow_html=True,
                 )
             with col2:
-                st.markdown(f"<b>Projected Median Age ({target_year}):</b>", unsafe_allow_html=True)
                 if projected_median_age:
                     st.markdown(
-                        f"<div style='font-size:1.5em; font-weight:bold; color:#ff7f0e;'>{projected_median_age:.1f} years</div>",
+                        metric_block(f"Projected Median Age ({target_year}):", f"{projected_median_age:.1f} years", "#ff7f0e"),
                         unsafe_allow_html=True,
                     )
                 else:
                     st.markdown(
-                        f"<div style='font-size:1.5em; font-weight:bold; color:gray;'>N/A</div>",
+                        metric_block(f"Projected Median Age ({target_year}):", "N/A", "gray"),
                         unsafe_allow_html=True,
                     )
             
 
     except Exception as e:
         st.error(f"Error in calculation: {e}")
-else:
+elif show_results:
     st.warning(
         "Please enter positive values for all inputs and ensure target year is in the future."
     )
@@ -1,6 +1,74 @@
 import plotly.graph_objects as go
 from utils import fetch_india_sector_gdp
-from ai_insights import get_ai_insight
+from ai_insights import get_ai_insights_bulk
+
+# Color scheme for grouped sectors (brown/blue/green)
+_GROUP_COLORS = {
+    'agriculture': '#8B4513',
+    'industry': '#4169E1',
+    'services': '#32CD32'
+}
+
+# Color scheme for detailed sectors
+_DETAILED_COLORS = {
+    'agriculture': '#8B4513',
+    'manufacturing': '#4169E1',
+    'construction': '#4682B4',
+    'mining': '#5F9EA0',
+    'utilities': '#20B2AA',
+    'trade_hotels': '#32CD32',
+    'financial_services': '#228B22',
+    'real_estate': '#006400',
+    'public_admin': '#90EE90',
+    'other_services': '#98FB98'
+}
+
+# Sector grouping used for both aggregation and sunburst parenting
+_INDUSTRY_SECTORS = frozenset({'manufacturing', 'construction', 'mining', 'utilities'})
+_SERVICES_SECTORS = frozenset({'trade_hotels', 'financial_services', 'real_estate',
+                               'public_admin', 'other_services'})
+
+# Display names precomputed once instead of .replace().title() per loop pass
+_PRETTY = {key: key.replace('_', ' ').title() for key in {**_DETAILED_COLORS, **_GROUP_COLORS}}
+
+# The sector schema is static, so the label/parent/color structure of the
+# sunburst is built once here; only values and hover texts vary per call.
+# Agriculture's detail row is labelled 'Farming' and parented under the group.
+_SUNBURST_DETAIL = tuple(
+    ('Farming' if sector == 'agriculture' else _PRETTY[sector],
+     'Agriculture' if sector == 'agriculture'
+     else ('Industry' if sector in _INDUSTRY_SECTORS else 'Services'),
+     sector)
+    for sector in _DETAILED_COLORS
+)
+_SUNBURST_LABELS = ['Agriculture', 'Industry', 'Services'] + [row[0] for row in _SUNBURST_DETAIL]
+_SUNBURST_PARENTS = ['', '', ''] + [row[1] for row in _SUNBURST_DETAIL]
+_SUNBURST_COLORS = ([_GROUP_COLORS['agriculture'], _GROUP_COLORS['industry'], _GROUP_COLORS['services']]
+                    + [_DETAILED_COLORS[row[2]] for row in _SUNBURST_DETAIL])
+
+
+def _aggregate_sectors(sector_data):
+    """
+    Total the agriculture/industry/services groups in a single pass.
+
+    Args:
+        sector_data: Raw sector dict from fetch_india_sector_gdp
+
+    Returns:
+        tuple: (agriculture_total, industry_total, services_total)
+    """
+    agriculture_total = industry_total = services_total = 0.0
+    for sector, data in sector_data.items():
+        if not isinstance(data, dict) or 'percentage' not in data:
+            continue
+        percentage = data['percentage']
+        if sector == 'agriculture':
+            agriculture_total += percentage
+        elif sector in _INDUSTRY_SECTORS:
+            industry_total += percentage
+        elif sector in _SERVICES_SECTORS:
+            services_total += percentage
+    return agriculture_total, industry_total, services_total
 
 
 def create_sector_sunburst_chart():
@@ -16,87 +84,42 @@ def create_sector_sunburst_chart():
     if not sector_data:
         return None
     
-    # Color scheme for grouped sectors
-    agriculture_color = '#8B4513'  # Brown for agriculture
-    industry_color = '#4169E1'     # Blue for industry
-    services_color = '#32CD32'     # Green for services
-    
-    # Color scheme for detailed sectors
-    detailed_colors_scheme = {
-        'agriculture': '#8B4513',
-        'manufacturing': '#4169E1',
-        'construction': '#4682B4',
-        'mining': '#5F9EA0',
-        'utilities': '#20B2AA',
-        'trade_hotels': '#32CD32',
-        'financial_services': '#228B22',
-        'real_estate': '#006400',
-        'public_admin': '#90EE90',
-        'other_services': '#98FB98'
+    # Calculate grouped values in one pass over the sector dict
+    agriculture_total, industry_total, services_total = _aggregate_sectors(sector_data)
+
+    # Compute the data year once instead of per insight call
+    year = next(iter(sector_data.values())).get('year', 2023)
+
+    # Collect every sector that needs an insight, then fetch them in one
+    # batched call instead of one LLM round-trip per sector
+    sector_percentages = {
+        'Agriculture': agriculture_total,
+        'Industry': industry_total,
+        'Services': services_total
     }
-    
-    # Calculate grouped values
-    agriculture_total = sector_data.get('agriculture', {}).get('percentage', 0)
-    
-    # Industry sectors (manufacturing, construction, mining, utilities)
-    industry_sectors = ['manufacturing', 'construction', 'mining', 'utilities']
-    industry_total = sum(sector_data.get(sector, {}).get('percentage', 0) for sector in industry_sectors)
-    
-    # Services sectors (trade_hotels, financial_services, real_estate, public_admin, other_services)
-    services_sectors = ['trade_hotels', 'financial_services', 'real_estate', 'public_admin', 'other_services']
-    services_total = sum(sector_data.get(sector, {}).get('percentage', 0) for sector in services_sectors)
-    
-    # Create hierarchical data for sunburst chart
-    labels = []
-    parents = []
-    values = []
-    colors = []
-    hover_texts = []
-    
-    # Add main sectors
-    labels.extend(['Agriculture', 'Industry', 'Services'])
-    parents.extend(['', '', ''])
-    values.extend([agriculture_total, industry_total, services_total])
-    colors.extend([agriculture_color, industry_color, services_color])
-    hover_texts.extend([
-        get_ai_insight("Agriculture", agriculture_total, sector_data),
-        get_ai_insight("Industry", industry_total, sector_data),
-        get_ai_insight("Services", services_total, sector_data)
-    ])
-    
-    # Add detailed sectors (including farming as child of agriculture)
     for sector, data in sector_data.items():
-        if isinstance(data, dict) and 'percentage' in data:
-            if sector == 'agriculture':
-                # Add farming as child of agriculture
-                labels.append('Farming')
-                values.append(data['percentage'])
-                colors.append(detailed_colors_scheme.get(sector, '#808080'))
-                parents.append('Agriculture')
-                hover_texts.append(get_ai_insight("Agriculture", data['percentage'], sector_data))
-            else:
-                # Add other sectors as before
-                sector_name = sector.replace('_', ' ').title()
-                labels.append(sector_name)
-                values.append(data['percentage'])
-                colors.append(detailed_colors_scheme.get(sector, '#808080'))
-                
-                # Determine parent
-                if sector in ['manufacturing', 'construction', 'mining', 'utilities']:
-                    parents.append('Industry')
-                else:
-                    parents.append('Services')
-                
-                # Create dynamic AI-powered hover text
-                sector_name = sector.replace('_', ' ').title()
-                hover_texts.append(get_ai_insight(sector_name, data['percentage'], sector_data))
-    
+        if isinstance(data, dict) and 'percentage' in data and sector != 'agriculture':
+            sector_percentages[_PRETTY.get(sector, sector.replace('_', ' ').title())] = data['percentage']
+    insights = get_ai_insights_bulk(sector_percentages, sector_data, year)
+
+    # Only the per-call pieces get built here; labels/parents/colors come
+    # from the precomputed module-level structure
+    values = [agriculture_total, industry_total, services_total] + [
+        sector_data.get(sector, {}).get('percentage', 0) for _, _, sector in _SUNBURST_DETAIL
+    ]
+    # .get() so a sector missing from the fetched data degrades to an empty
+    # hover instead of a KeyError (the detail schema is static, the data isn't)
+    hover_texts = [insights['Agriculture'], insights['Industry'], insights['Services']] + [
+        insights['Agriculture'] if sector == 'agriculture' else insights.get(label, '')
+        for label, _, sector in _SUNBURST_DETAIL
+    ]
+
     # Create sunburst chart
     fig = go.Figure(go.Sunburst(
-        labels=labels,
-        parents=parents,
+        labels=_SUNBURST_LABELS,
+        parents=_SUNBURST_PARENTS,
         values=values,
-        marker=dict(colors=colors),
+        marker=dict(colors=_SUNBURST_COLORS),
         textinfo='label',
         textfont=dict(size=12),
         hovertemplate='<b>%{label}</b><br><br>%{customdata}<extra></extra>',
@@ -108,7 +131,7 @@ def create_sector_sunburst_chart():
     # Update layout for sunburst chart
     fig.update_layout(
         title={
-            'text': f"Current GDP Sector Distribution ({list(sector_data.values())[0]['year']})",
+            'text': f"Current GDP Sector Distribution ({year})",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 18}
@@ -134,17 +157,9 @@ def get_sector_data():
     if not sector_data:
         return None
     
-    # Calculate grouped values
-    agriculture_total = sector_data.get('agriculture', {}).get('percentage', 0)
-    
-    # Industry sectors (manufacturing, construction, mining, utilities)
-    industry_sectors = ['manufacturing', 'construction', 'mining', 'utilities']
-    industry_total = sum(sector_data.get(sector, {}).get('percentage', 0) for sector in industry_sectors)
-    
-    # Services sectors (trade_hotels, financial_services, real_estate, public_admin, other_services)
-    services_sectors = ['trade_hotels', 'financial_services', 'real_estate', 'public_admin', 'other_services']
-    services_total = sum(sector_data.get(sector, {}).get('percentage', 0) for sector in services_sectors)
-    
+    # Calculate grouped values in one pass over the sector dict
+    agriculture_total, industry_total, services_total = _aggregate_sectors(sector_data)
+
     return {
         'raw_data': sector_data,
         'grouped': {
@@ -152,7 +167,7 @@ def get_sector_data():
             'industry': industry_total,
             'services': services_total
         },
-        'year': list(sector_data.values())[0]['year'] if sector_data else None
+        'year': next(iter(sector_data.values()))['year'] if sector_data else None
     }
 
 
@@ -176,19 +191,12 @@ def create_projected_sector_pie_chart(projections: dict, target_year: int = 2047
     colors = []
     hover_texts = []
     
-    # Color scheme for sectors
-    sector_colors = {
-        'agriculture': '#8B4513',  # Brown
-        'industry': '#4169E1',     # Blue
-        'services': '#32CD32'      # Green
-    }
-    
     for sector, data in projections.items():
         if 'projected_value' in data:
-            sector_name = sector.replace('_', ' ').title()
+            sector_name = _PRETTY.get(sector, sector.replace('_', ' ').title())
             labels.append(sector_name)
             values.append(data['projected_value'])
-            colors.append(sector_colors.get(sector, '#808080'))
+            colors.append(_GROUP_COLORS.get(sector, '#808080'))
             
             # Create hover text with growth information
             current = data['current_value']
@@ -261,14 +269,7 @@ def create_comparison_country_pie_chart(country_name: str, sector_data: dict, si
     if not values:
         return None
     
-    # Color scheme for sectors
-    sector_colors = {
-        'agriculture': '#8B4513',  # Brown
-        'industry': '#4169E1',     # Blue
-        'services': '#32CD32'      # Green
-    }
-    
-    colors = [sector_colors.get(label.lower(), '#808080') for label in labels]
+    colors = [_GROUP_COLORS.get(label.lower(), '#808080') for label in labels]
     
     # Create pie chart
     fig = go.Figure(data=[go.Pie(
@@ -0,0 +1,33 @@
+"""
+One-shot prep: convert the per-capita GDP CSV into a cleaned Parquet file.
+
+Run this after updating gdp-per-capita-by-country-2025.csv. The dashboard
+loads gdp_per_capita_2025.parquet when it exists, which skips the currency
+regex cleanup and float cast at runtime and loads typed columns directly.
+"""
+
+import pandas as pd
+
+CSV_PATH = "gdp-per-capita-by-country-2025.csv"
+PARQUET_PATH = "gdp_per_capita_2025.parquet"
+PER_CAPITA_COLUMN = "GDPPerCapita_GDPPerCapitaViaIMF_usd_2025"
+
+
+def main():
+    df = pd.read_csv(CSV_PATH)
+    df[PER_CAPITA_COLUMN] = pd.to_numeric(
+        df[PER_CAPITA_COLUMN]
+        .str.replace("$", "", regex=False)
+        .str.replace(",", "", regex=False),
+        errors="coerce",
+    )
+    df = df.dropna(subset=[PER_CAPITA_COLUMN])
+    # Match the dashboard loader's compact dtypes
+    df[PER_CAPITA_COLUMN] = df[PER_CAPITA_COLUMN].astype("float32")
+    df["country"] = df["country"].astype("category")
+    df.to_parquet(PARQUET_PATH, index=False)
+    print(f"Wrote {len(df)} rows to {PARQUET_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,106 @@
 import math
-from typing import Dict, Optional
+import os
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# orjson parses the World Bank payloads a few times faster than stdlib json;
+# fall back silently when it isn't installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-def get_india_gdp_usd():
-    """Fetch India's current GDP in USD from World Bank API"""
+# Shared session so every fetch reuses one keep-alive TCP/TLS connection to
+# api.worldbank.org instead of paying a fresh handshake per request. With
+# requests-cache installed, responses also persist to a sqlite file for a day,
+# so cold process starts (e.g. Streamlit Cloud container restarts) reuse the
+# cached JSON instead of re-hitting the API.
+try:
+    from datetime import timedelta
+
+    import requests_cache
+
+    # cache_control=True also sends If-None-Match/If-Modified-Since when an
+    # entry has expired, so unchanged data revalidates with a bodyless 304
+    # instead of re-downloading and re-parsing the full payload
+    _SESSION = requests_cache.CachedSession(
+        ".worldbank_cache",
+        backend="sqlite",
+        expire_after=timedelta(days=1),
+        allowable_codes=(200,),
+        cache_control=True,
+    )
+except ImportError:
+    _SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+    ),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+# Set once on the session rather than per call
+_SESSION.headers.update({"Accept": "application/json", "User-Agent": "30by47/1.0"})
+
+# NOFETCH=1 makes every fetcher return its fallback immediately, skipping the
+# network entirely — handy for offline/CLI runs that only need the constants
+_OFFLINE = bool(os.environ.get("NOFETCH"))
+
+# Shared insight template, parsed once instead of re-parsing an f-string's
+# format specs on every loop iteration
+_INSIGHT_TEMPLATE = (
+    "{name} sector projected to {trend} from {cur:.1f}% to {proj:.1f}% by 2047 "
+    "(annual growth: {growth:.2f}%). This represents a {change:+.1f}% change "
+    "over the projection period."
+)
+
+class _YearValue(NamedTuple):
+    """One (year, value) observation from a World Bank series.
+
+    Fixed-offset attribute access instead of per-lookup dict hashing in
+    the regression loop, and year-first so plain sort() orders by year.
+    """
+
+    year: int
+    value: float
+
+
+# World Bank indicators for sector value added (% of GDP)
+_SECTOR_INDICATORS = {
+    'agriculture': 'NV.AGR.TOTL.ZS',
+    'industry': 'NV.IND.TOTL.ZS',
+    'services': 'NV.SRV.TOTL.ZS'
+}
+
+
+def get_india_gdp_usd(network=True):
+    """Fetch India's current GDP in USD from World Bank API
+
+    Pass network=False (or set NOFETCH=1) to skip the HTTP call and return
+    the fallback estimate immediately.
+    """
+    if not network or _OFFLINE:
+        return 10000.0
     # World Bank API for India's GDP (NY.GDP.MKTP.CD) in USD, most recent year
     url = "https://api.worldbank.org/v2/country/IN/indicator/NY.GDP.MKTP.CD?format=json&per_page=1"
     try:
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=(1.5, 4))
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             if isinstance(data, list) and len(data) > 1 and data[1]:
                 gdp = data[1][0].get("value")
                 if gdp:
@@ -22,13 +111,15 @@ def get_india_gdp_usd():
     return 10000.0  # 4271920000000.0
 
 
-def fetch_latest_gdp_growth():
+def fetch_latest_gdp_growth(network=True):
     """Fetch latest GDP growth rate of India from World Bank API"""
+    if not network or _OFFLINE:
+        return None, None
     url = "https://api.worldbank.org/v2/country/IN/indicator/NY.GDP.MKTP.KD.ZG?format=json&per_page=2"
     try:
-        resp = requests.get(url, timeout=5)
+        resp = _SESSION.get(url, timeout=(1.5, 4))
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             if isinstance(data, list) and len(data) > 1 and data[1]:
                 for entry in data[1]:
                     if entry.get("value") is not None:
@@ -38,13 +129,15 @@ def fetch_latest_gdp_growth():
     return None, None
 
 
-def fetch_india_population():
+def fetch_india_population(network=True):
     """Fetch India's population from World Bank API"""
+    if not network or _OFFLINE:
+        return None, None
     url = "https://api.worldbank.org/v2/country/IN/indicator/SP.POP.TOTL?format=json&per_page=2"
     try:
-        resp = requests.get(url, timeout=5)
+        resp = _SESSION.get(url, timeout=(1.5, 4))
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             if isinstance(data, list) and len(data) > 1 and data[1]:
                 for entry in data[1]:
                     if entry.get("value") is not None:
@@ -54,16 +147,19 @@ def fetch_india_population():
     return None, None
 
 
-def fetch_india_median_age():
+def fetch_india_median_age(network=True):
     """Fetch India's current median age from reliable demographic sources"""
-    # Try multiple sources for India's median age
-    
+    # Callers that are happy with the 28.7/2023 fallback can bypass the
+    # network entirely with network=False (or NOFETCH=1)
+    if not network or _OFFLINE:
+        return 28.7, 2023
+
     # Source 1: Try World Bank API with different indicator
     url = "https://api.worldbank.org/v2/country/IN/indicator/SP.POP.0014.TO.ZS?format=json&per_page=2"
     try:
-        resp = requests.get(url, timeout=5)
+        resp = _SESSION.get(url, timeout=(1.5, 4))
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             if isinstance(data, list) and len(data) > 1 and data[1]:
                 for entry in data[1]:
                     if entry.get("value") is not None:
@@ -82,13 +178,15 @@ def fetch_india_median_age():
     return 28.7, 2023
 
 
-def fetch_india_dependency_ratio():
+def fetch_india_dependency_ratio(network=True):
     """Fetch India's dependency ratio (young + old dependents / working age population)"""
+    if not network or _OFFLINE:
+        return None, None
     url = "https://api.worldbank.org/v2/country/IN/indicator/SP.POP.DPND?format=json&per_page=2"
     try:
-        resp = requests.get(url, timeout=5)
+        resp = _SESSION.get(url, timeout=(1.5, 4))
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             if isinstance(data, list) and len(data) > 1 and data[1]:
                 for entry in data[1]:
                     if entry.get("value") is not None:
@@ -98,24 +196,140 @@ def fetch_india_dependency_ratio():
     return None, None
 
 
+def _fetch_indicators_bulk(country, codes, date_range=None, per_page=200):
+    """Fetch several World Bank indicators for one country in a single request.
+
+    The API accepts ';'-joined indicator codes (with source=2), so one
+    round-trip replaces one HTTP call per indicator.
+
+    Args:
+        country: World Bank country code (e.g. 'IN', 'IND', 'USA')
+        codes: List of World Bank indicator codes
+        date_range: Optional 'YYYY:YYYY' range filter
+        per_page: Entries to request across all indicators
+
+    Returns:
+        dict: Mapping of indicator code to its entries (newest first)
+    """
+    url = f"https://api.worldbank.org/v2/country/{country}/indicator/{';'.join(codes)}"
+    params = {"format": "json", "source": 2, "per_page": per_page}
+    if date_range:
+        params["date"] = date_range
+    try:
+        resp = _SESSION.get(url, params=params, timeout=(1.5, 10))
+        if resp.status_code == 200:
+            data = _json_loads(resp.content)
+            if isinstance(data, list) and len(data) > 1 and data[1]:
+                grouped = {code: [] for code in codes}
+                for entry in data[1]:
+                    code = entry.get("indicator", {}).get("id")
+                    if code in grouped:
+                        grouped[code].append(entry)
+                return grouped
+    except Exception as e:
+        print(f"Could not batch-fetch World Bank indicators for {country}: {e}")
+    return {}
+
+
+def fetch_india_indicators(codes, date_range=None, per_page=200):
+    """Fetch several World Bank indicators for India in a single request.
+
+    Without a date_range the API returns each series in full (~65 annual
+    rows per indicator), so per_page defaults high enough to cover several
+    undated series; prefer passing a range and sizing per_page to match.
+    """
+    return _fetch_indicators_bulk("IN", codes, date_range=date_range, per_page=per_page)
+
+
+def _latest_entry_value(entries):
+    """Return (value, date) of the newest non-null entry, or (None, None)."""
+    for entry in entries:
+        if entry.get("value") is not None:
+            return float(entry["value"]), entry.get("date")
+    return None, None
+
+
+def fetch_india_snapshot():
+    """Fetch GDP, growth, population, median age and dependency ratio at once.
+
+    Issues one batched World Bank request instead of five separate calls and
+    returns a dict shaped like the individual fetchers' results; indicators
+    missing from the batched response fall back to their standalone fetchers.
+    """
+    codes = {
+        'gdp': 'NY.GDP.MKTP.CD',
+        'growth': 'NY.GDP.MKTP.KD.ZG',
+        'population': 'SP.POP.TOTL',
+        'under_14': 'SP.POP.0014.TO.ZS',
+        'dependency_ratio': 'SP.POP.DPND',
+    }
+    # The multi-indicator endpoint returns each series in full unless dated,
+    # so bound the query to recent years and size per_page to cover them all
+    # (same pattern as fetch_sector_growth_projections)
+    current_year = datetime.now().year
+    grouped = fetch_india_indicators(
+        list(codes.values()),
+        date_range=f"{current_year - 7}:{current_year}",
+        per_page=len(codes) * 8,
+    )
+
+    gdp, _ = _latest_entry_value(grouped.get(codes['gdp'], []))
+    growth, growth_year = _latest_entry_value(grouped.get(codes['growth'], []))
+    population, pop_year = _latest_entry_value(grouped.get(codes['population'], []))
+    under_14, age_year = _latest_entry_value(grouped.get(codes['under_14'], []))
+    dependency, dep_year = _latest_entry_value(grouped.get(codes['dependency_ratio'], []))
+
+    if under_14 is not None:
+        # Same under-14 share to median-age estimate as fetch_india_median_age
+        median_age = (round(28.5 + (25 - under_14) * 0.3, 1), int(age_year))
+    else:
+        median_age = fetch_india_median_age()
+
+    return {
+        'gdp': gdp if gdp is not None else get_india_gdp_usd(),
+        'growth': (growth, growth_year) if growth is not None else fetch_latest_gdp_growth(),
+        'population': (population, int(pop_year)) if population is not None else fetch_india_population(),
+        'median_age': median_age,
+        'dependency_ratio': (dependency, int(dep_year)) if dependency is not None else fetch_india_dependency_ratio(),
+    }
+
+
+def fetch_all_india_stats(target_year: int = 2047):
+    """Fetch everything the dashboard needs in two concurrent round-trips.
+
+    The batched snapshot (GDP, growth, population, median age, dependency
+    ratio) and the date-ranged sector projections query are independent, so
+    they run in a small thread pool and wall time is the slower of the two
+    instead of their sum.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        snapshot_future = executor.submit(fetch_india_snapshot)
+        projections_future = executor.submit(fetch_sector_growth_projections, target_year)
+        stats = snapshot_future.result()
+        stats['projections'] = projections_future.result()
+        return stats
+
+
+@lru_cache(maxsize=1)
 def fetch_historical_median_age():
     """Fetch historical median age data for India from World Bank API"""
     # Try to get historical data using population under 14 as proxy
     url = "https://api.worldbank.org/v2/country/IN/indicator/SP.POP.0014.TO.ZS?format=json&per_page=20"
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _SESSION.get(url, timeout=(1.5, 10))
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             if isinstance(data, list) and len(data) > 1 and data[1]:
-                historical_data = []
-                for entry in data[1]:
-                    if entry.get("value") is not None:
-                        year = int(entry.get("date"))
-                        under_14_pct = float(entry["value"])
-                        # Convert to estimated median age
-                        estimated_median = 28.5 + (25 - under_14_pct) * 0.3
-                        historical_data.append((year, round(estimated_median, 1)))
-                return historical_data
+                entries = [e for e in data[1] if e.get("value") is not None]
+                if entries:
+                    # Convert the under-14 shares to median-age estimates in
+                    # one vectorized pass instead of per-row arithmetic
+                    years = np.fromiter((int(e["date"]) for e in entries),
+                                        dtype=np.int32, count=len(entries))
+                    under_14 = np.fromiter((float(e["value"]) for e in entries),
+                                           dtype=np.float64, count=len(entries))
+                    medians = np.round(28.5 + (25 - under_14) * 0.3, 1)
+                    return list(zip(years.tolist(), medians.tolist()))
     except Exception as e:
         print(f"Could not fetch historical median age data: {e}")
     
@@ -129,77 +343,85 @@ def fetch_historical_median_age():
     ]
 
 
+# Comprehensive and normalized sector data from reliable sources
+# Source: World Bank, RBI, Ministry of Statistics - normalized to 100%
+# Built once and exposed read-only; callers that need to mutate must copy
+_INDIA_SECTOR_GDP = types.MappingProxyType({
+    'agriculture': {'percentage': 16.2, 'year': 2023},
+    'manufacturing': {'percentage': 13.0, 'year': 2023},
+    'construction': {'percentage': 7.8, 'year': 2023},
+    'mining': {'percentage': 2.5, 'year': 2023},
+    'utilities': {'percentage': 2.5, 'year': 2023},
+    'trade_hotels': {'percentage': 15.8, 'year': 2023},
+    'financial_services': {'percentage': 7.2, 'year': 2023},
+    'real_estate': {'percentage': 7.8, 'year': 2023},
+    'public_admin': {'percentage': 6.2, 'year': 2023},
+    'other_services': {'percentage': 21.0, 'year': 2023}
+})
+
+
 def fetch_india_sector_gdp():
     """Fetch India's comprehensive sector-wise GDP data from World Bank API"""
-    # Use comprehensive and normalized data from reliable sources
-    # Source: World Bank, RBI, Ministry of Statistics - normalized to 100%
-    # This includes detailed sector breakdown that adds up to exactly 100%
-    return {
-        'agriculture': {'percentage': 16.2, 'year': 2023},
-        'manufacturing': {'percentage': 13.0, 'year': 2023},
-        'construction': {'percentage': 7.8, 'year': 2023},
-        'mining': {'percentage': 2.5, 'year': 2023},
-        'utilities': {'percentage': 2.5, 'year': 2023},
-        'trade_hotels': {'percentage': 15.8, 'year': 2023},
-        'financial_services': {'percentage': 7.2, 'year': 2023},
-        'real_estate': {'percentage': 7.8, 'year': 2023},
-        'public_admin': {'percentage': 6.2, 'year': 2023},
-        'other_services': {'percentage': 21.0, 'year': 2023}
-    }
+    # Detailed sector breakdown that adds up to exactly 100%
+    return _INDIA_SECTOR_GDP
+
+
+# UN growth-rate brackets: (last year of bracket, annual rate)
+_POP_GROWTH_BRACKETS = (
+    (2025, 0.010),  # 1.0%
+    (2030, 0.008),  # 0.8%
+    (2040, 0.005),  # 0.5%
+    (math.inf, 0.003),  # 0.3%
+)
 
 
 def project_population(base_pop, base_year, target_year):
     """Project India's population for a given year using UN growth rates"""
-    def get_growth_rate(year):
-        if year <= 2025:
-            return 0.010  # 1.0%
-        elif year <= 2030:
-            return 0.008  # 0.8%
-        elif year <= 2040:
-            return 0.005  # 0.5%
-        else:
-            return 0.003  # 0.3%
-    
-    years_diff = target_year - base_year
+    # The rate is piecewise-constant, so compound each bracket in closed form
+    # instead of looping year by year
     pop = base_pop
-    for y in range(base_year + 1, target_year + 1):
-        pop *= (1 + get_growth_rate(y))
+    start = base_year
+    for bracket_end, rate in _POP_GROWTH_BRACKETS:
+        years_in_bracket = min(target_year, bracket_end) - start
+        if years_in_bracket > 0:
+            pop *= (1 + rate) ** years_in_bracket
+            start += years_in_bracket
+        if start >= target_year:
+            break
     return pop
 
 
-def project_median_age_evidence_based(current_age, base_year, target_year):
-    """Project India's median age using evidence-based historical trends"""
-    # Get historical data to calculate trend
+@lru_cache(maxsize=1)
+def _get_age_trend_slope():
+    """Average annual median-age increase from the cached historical series.
+
+    Falls back to a conservative 0.3 years/year when the series is too short.
+    """
     historical_data = fetch_historical_median_age()
-    
     if len(historical_data) >= 2:
-        # Calculate average annual increase from historical data
-        years = [data[0] for data in historical_data]
-        ages = [data[1] for data in historical_data]
-        
-        # Calculate trend using linear regression (simplified)
-        n = len(years)
-        if n > 1:
-            # Calculate average annual increase
-            total_increase = ages[-1] - ages[0]
-            total_years = years[-1] - years[0]
-            annual_increase = total_increase / total_years if total_years > 0 else 0.3
-            
-            # Project to target year
-            years_to_project = target_year - base_year
-            projected_age = current_age + (annual_increase * years_to_project)
-            return round(projected_age, 1)
-    
-    # Fallback: Use conservative estimate based on demographic transition
+        first_year, first_age = historical_data[0]
+        last_year, last_age = historical_data[-1]
+        total_years = last_year - first_year
+        if total_years > 0:
+            return (last_age - first_age) / total_years
+    return 0.3
+
+
+def project_median_age_evidence_based(current_age, base_year, target_year):
+    """Project India's median age using evidence-based historical trends"""
+    # The trend slope is cached, so repeat projections are pure arithmetic
+    annual_increase = _get_age_trend_slope()
     years_to_project = target_year - base_year
-    projected_age = current_age + (years_to_project * 0.3)  # Conservative 0.3 years per year
+    projected_age = current_age + (annual_increase * years_to_project)
     return round(projected_age, 1)
 
 
 def calculate_required_growth(current, target, time):
     """Calculate required annual growth rate to reach target GDP"""
     if current > 0 and target > 0 and time > 0:
-        return 100 * (10 ** (math.log10(target / current) / time) - 1)
+        # expm1/log form: one fewer transcendental call than log10 + 10**,
+        # and no cancellation for growth rates close to zero
+        return 100.0 * math.expm1(math.log(target / current) / time)
     return None
 
 
@@ -213,96 +435,70 @@ def fetch_sector_growth_projections(target_year: int = 2047) -> Dict[str, Dict[s
     Returns:
         dict: Dictionary with sector projections and growth rates
     """
-    import requests
-    from datetime import datetime
-    
     current_year = datetime.now().year
     years_back = 10  # Get 10 years of historical data for trend analysis
     
-    # World Bank indicators for sector value added (% of GDP)
-    indicators = {
-        'agriculture': 'NV.AGR.TOTL.ZS',
-        'industry': 'NV.IND.TOTL.ZS', 
-        'services': 'NV.SRV.TOTL.ZS'
-    }
+    indicators = _SECTOR_INDICATORS
     
+    # One batched request covers all three sector series for the date range
+    grouped = _fetch_indicators_bulk(
+        'IND',
+        list(indicators.values()),
+        date_range=f"{current_year - years_back}:{current_year}",
+        per_page=len(indicators) * (years_back + 1),
+    )
+
     projections = {}
-    
+
     for sector_name, indicator in indicators.items():
         try:
-            # Fetch historical data from World Bank
-            url = f"https://api.worldbank.org/v2/country/IND/indicator/{indicator}"
-            params = {
-                'format': 'json',
-                'per_page': years_back,
-                'date': f"{current_year - years_back}:{current_year}"
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if len(data) > 1 and data[1]:
-                    # Extract year-value pairs
-                    historical_data = []
-                    for entry in data[1]:
-                        if entry['value'] is not None:
-                            historical_data.append({
-                                'year': int(entry['date']),
-                                'value': float(entry['value'])
-                            })
-                    
-                    if len(historical_data) >= 3:
-                        # Sort by year
-                        historical_data.sort(key=lambda x: x['year'])
-                        
-                        # Calculate trend (simple linear regression)
-                        years = [d['year'] for d in historical_data]
-                        values = [d['value'] for d in historical_data]
-                        
-                        # Linear regression for trend
-                        n = len(years)
-                        sum_x = sum(years)
-                        sum_y = sum(values)
-                        sum_xy = sum(x * y for x, y in zip(years, values))
-                        sum_x2 = sum(x * x for x in years)
-                        
-                        # Calculate slope and intercept
-                        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-                        intercept = (sum_y - slope * sum_x) / n
-                        
-                        # Project to target year
-                        projected_value = slope * target_year + intercept
-                        
-                        # Get current value (most recent)
-                        current_value = values[-1]
-                        
-                        # Calculate annual growth rate
-                        years_diff = target_year - years[-1]
-                        if years_diff > 0:
-                            annual_growth = ((projected_value / current_value) ** (1/years_diff) - 1) * 100
-                        else:
-                            annual_growth = 0
-                        
-                        projections[sector_name] = {
-                            'current_value': current_value,
-                            'projected_value': projected_value,
-                            'annual_growth_rate': annual_growth,
-                            'trend_slope': slope,
-                            'data_points': len(historical_data),
-                            'years_analyzed': f"{years[0]}-{years[-1]}"
-                        }
+            entries = grouped.get(indicator)
+            if entries:
+                # Extract year-value pairs
+                historical_data = [
+                    _YearValue(int(entry['date']), float(entry['value']))
+                    for entry in entries
+                    if entry['value'] is not None
+                ]
+
+                if len(historical_data) >= 3:
+                    # Sort by year (first tuple field)
+                    historical_data.sort()
+
+                    # Linear regression for trend, vectorized
+                    years = np.fromiter((d.year for d in historical_data), dtype=np.float64)
+                    values = np.fromiter((d.value for d in historical_data), dtype=np.float64)
+                    slope, intercept = np.polyfit(years, values, 1)
+
+                    # Project to target year
+                    projected_value = float(slope * target_year + intercept)
+
+                    # Get current value (most recent)
+                    current_value = float(values[-1])
+
+                    # Calculate annual growth rate
+                    years_diff = target_year - years[-1]
+                    if years_diff > 0:
+                        annual_growth = ((projected_value / current_value) ** (1/years_diff) - 1) * 100
                     else:
-                        print(f"Insufficient data for {sector_name} trend analysis")
+                        annual_growth = 0
+
+                    projections[sector_name] = {
+                        'current_value': current_value,
+                        'projected_value': projected_value,
+                        'annual_growth_rate': annual_growth,
+                        'trend_slope': float(slope),
+                        'data_points': len(historical_data),
+                        'years_analyzed': f"{int(years[0])}-{int(years[-1])}"
+                    }
                 else:
-                    print(f"No data available for {sector_name}")
+                    print(f"Insufficient data for {sector_name} trend analysis")
             else:
-                print(f"API request failed for {sector_name}: {response.status_code}")
-                
+                print(f"No data available for {sector_name}")
+
         except Exception as e:
-            print(f"Error fetching {sector_name} projections: {e}")
-    
+            print(f"Error processing {sector_name} projections: {e}")
+
     return projections
 
 
@@ -333,10 +529,13 @@ def get_sector_growth_insights(projections: Dict[str, Dict[str, float]]) -> Dict
             trend = "stable"
         
         change_percentage = ((projected - current) / current) * 100
-        
-        insights[sector] = f"{sector_name} sector projected to {trend} from {current:.1f}% to {projected:.1f}% by 2047 (annual growth: {growth_rate:.2f}%). This represents a {change_percentage:+.1f}% change over the projection period."
-    
-    return insights 
+
+        insights[sector] = _INSIGHT_TEMPLATE.format(
+            name=sector_name, trend=trend, cur=current, proj=projected,
+            growth=growth_rate, change=change_percentage
+        )
+
+    return insights
 
 
 def fetch_country_sector_gdp(country_code: str) -> Optional[Dict[str, Dict[str, float]]]:
@@ -349,51 +548,40 @@ def fetch_country_sector_gdp(country_code: str) -> Optional[Dict[str, Dict[str,
     Returns:
         dict: Dictionary with sector data or None if not available
     """
-    import requests
-    
-    # World Bank indicators for sector value added (% of GDP)
-    indicators = {
-        'agriculture': 'NV.AGR.TOTL.ZS',
-        'industry': 'NV.IND.TOTL.ZS', 
-        'services': 'NV.SRV.TOTL.ZS'
-    }
+    indicators = _SECTOR_INDICATORS
     
+    # One batched request covers the recent window for all three sectors
+    grouped = _fetch_indicators_bulk(
+        country_code,
+        list(indicators.values()),
+        date_range='2019:2024',
+        per_page=len(indicators) * 6,
+    )
+
     sector_data = {}
     latest_year = None
-    
+
     for sector_name, indicator in indicators.items():
         try:
-            # Fetch data from World Bank API
-            url = f"https://api.worldbank.org/v2/country/{country_code}/indicator/{indicator}"
-            params = {
-                'format': 'json',
-                'per_page': 5,  # Get last 5 years
-                'date': '2019:2024'  # Recent data
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if len(data) > 1 and data[1]:
-                    # Get the most recent data point
-                    latest_entry = None
-                    for entry in data[1]:
-                        if entry['value'] is not None:
-                            if latest_entry is None or int(entry['date']) > int(latest_entry['date']):
-                                latest_entry = entry
-                    
-                    if latest_entry:
-                        sector_data[sector_name] = {
-                            'percentage': float(latest_entry['value']),
-                            'year': int(latest_entry['date'])
-                        }
-                        if latest_year is None or int(latest_entry['date']) > latest_year:
-                            latest_year = int(latest_entry['date'])
-                            
+            entries = grouped.get(indicator)
+            if entries:
+                # Get the most recent data point
+                latest_entry = None
+                for entry in entries:
+                    if entry['value'] is not None:
+                        if latest_entry is None or int(entry['date']) > int(latest_entry['date']):
+                            latest_entry = entry
+
+                if latest_entry:
+                    sector_data[sector_name] = {
+                        'percentage': float(latest_entry['value']),
+                        'year': int(latest_entry['date'])
+                    }
+                    if latest_year is None or int(latest_entry['date']) > latest_year:
+                        latest_year = int(latest_entry['date'])
+
         except Exception as e:
-            print(f"Error fetching {sector_name} data for {country_code}: {e}")
+            print(f"Error processing {sector_name} data for {country_code}: {e}")
     
     # Only return data if we have at least 2 sectors
     if len(sector_data) >= 2:
@@ -408,6 +596,71 @@ def fetch_country_sector_gdp(country_code: str) -> Optional[Dict[str, Dict[str,
     return None
 
 
+# Common country name to ISO code mapping, built once at import
+_COUNTRY_CODE_MAP = {
+    'united states': 'USA',
+    'china': 'CHN',
+    'japan': 'JPN',
+    'germany': 'DEU',
+    'united kingdom': 'GBR',
+    'france': 'FRA',
+    'italy': 'ITA',
+    'canada': 'CAN',
+    'brazil': 'BRA',
+    'russia': 'RUS',
+    'india': 'IND',
+    'australia': 'AUS',
+    'spain': 'ESP',
+    'mexico': 'MEX',
+    'indonesia': 'IDN',
+    'netherlands': 'NLD',
+    'saudi arabia': 'SAU',
+    'turkey': 'TUR',
+    'switzerland': 'CHE',
+    'poland': 'POL',
+    'sweden': 'SWE',
+    'belgium': 'BEL',
+    'thailand': 'THA',
+    'israel': 'ISR',
+    'austria': 'AUT',
+    'singapore': 'SGP',
+    'norway': 'NOR',
+    'denmark': 'DNK',
+    'south africa': 'ZAF',
+    'egypt': 'EGY',
+    'philippines': 'PHL',
+    'finland': 'FIN',
+    'chile': 'CHL',
+    'colombia': 'COL',
+    'malaysia': 'MYS',
+    'ireland': 'IRL',
+    'pakistan': 'PAK',
+    'peru': 'PER',
+    'greece': 'GRC',
+    'new zealand': 'NZL',
+    'czech republic': 'CZE',
+    'portugal': 'PRT',
+    'romania': 'ROU',
+    'vietnam': 'VNM',
+    'bangladesh': 'BGD',
+    'hungary': 'HUN',
+    'ukraine': 'UKR',
+    'morocco': 'MAR',
+    'slovakia': 'SVK',
+    'bulgaria': 'BGR',
+    'croatia': 'HRV',
+    'tunisia': 'TUN',
+    'lithuania': 'LTU',
+    'slovenia': 'SVN',
+    'latvia': 'LVA',
+    'estonia': 'EST',
+    'cyprus': 'CYP',
+    'luxembourg': 'LUX',
+    'malta': 'MLT',
+    'iceland': 'ISL'
+}
+
+
 def get_country_code(country_name: str) -> Optional[str]:
     """
     Get ISO 3-letter country code from country name.
@@ -418,78 +671,88 @@ def get_country_code(country_name: str) -> Optional[str]:
     Returns:
         str: ISO 3-letter country code
     """
-    # Common country name to ISO code mapping
-    country_mapping = {
-        'united states': 'USA',
-        'china': 'CHN',
-        'japan': 'JPN',
-        'germany': 'DEU',
-        'united kingdom': 'GBR',
-        'france': 'FRA',
-        'italy': 'ITA',
-        'canada': 'CAN',
-        'brazil': 'BRA',
-        'russia': 'RUS',
-        'india': 'IND',
-        'australia': 'AUS',
-        'spain': 'ESP',
-        'mexico': 'MEX',
-        'indonesia': 'IDN',
-        'netherlands': 'NLD',
-        'saudi arabia': 'SAU',
-        'turkey': 'TUR',
-        'switzerland': 'CHE',
-        'poland': 'POL',
-        'sweden': 'SWE',
-        'belgium': 'BEL',
-        'thailand': 'THA',
-        'israel': 'ISR',
-        'austria': 'AUT',
-        'singapore': 'SGP',
-        'norway': 'NOR',
-        'denmark': 'DNK',
-        'south africa': 'ZAF',
-        'egypt': 'EGY',
-        'philippines': 'PHL',
-        'finland': 'FIN',
-        'chile': 'CHL',
-        'colombia': 'COL',
-        'malaysia': 'MYS',
-        'ireland': 'IRL',
-        'pakistan': 'PAK',
-        'peru': 'PER',
-        'greece': 'GRC',
-        'new zealand': 'NZL',
-        'czech republic': 'CZE',
-        'portugal': 'PRT',
-        'romania': 'ROU',
-        'vietnam': 'VNM',
-        'bangladesh': 'BGD',
-        'hungary': 'HUN',
-        'ukraine': 'UKR',
-        'morocco': 'MAR',
-        'slovakia': 'SVK',
-        'bulgaria': 'BGR',
-        'croatia': 'HRV',
-        'tunisia': 'TUN',
-        'lithuania': 'LTU',
-        'slovenia': 'SVN',
-        'latvia': 'LVA',
-        'estonia': 'EST',
-        'cyprus': 'CYP',
-        'luxembourg': 'LUX',
-        'malta': 'MLT',
-        'iceland': 'ISL'
-    }
-    
-    return country_mapping.get(country_name.lower(), None)
+    return _COUNTRY_CODE_MAP.get(country_name.lower())
+
+
+# Static country -> capital table covering the countries in
+# _COUNTRY_CODE_MAP; restcountries.com is only consulted for names
+# missing from it
+_CAPITAL_MAP = {
+    'united states': 'Washington, D.C.',
+    'china': 'Beijing',
+    'japan': 'Tokyo',
+    'germany': 'Berlin',
+    'united kingdom': 'London',
+    'france': 'Paris',
+    'italy': 'Rome',
+    'canada': 'Ottawa',
+    'brazil': 'Brasília',
+    'russia': 'Moscow',
+    'india': 'New Delhi',
+    'australia': 'Canberra',
+    'spain': 'Madrid',
+    'mexico': 'Mexico City',
+    'indonesia': 'Jakarta',
+    'netherlands': 'Amsterdam',
+    'saudi arabia': 'Riyadh',
+    'turkey': 'Ankara',
+    'switzerland': 'Bern',
+    'poland': 'Warsaw',
+    'sweden': 'Stockholm',
+    'belgium': 'Brussels',
+    'thailand': 'Bangkok',
+    'israel': 'Jerusalem',
+    'austria': 'Vienna',
+    'singapore': 'Singapore',
+    'norway': 'Oslo',
+    'denmark': 'Copenhagen',
+    'south africa': 'Pretoria',
+    'egypt': 'Cairo',
+    'philippines': 'Manila',
+    'finland': 'Helsinki',
+    'chile': 'Santiago',
+    'colombia': 'Bogotá',
+    'malaysia': 'Kuala Lumpur',
+    'ireland': 'Dublin',
+    'pakistan': 'Islamabad',
+    'peru': 'Lima',
+    'greece': 'Athens',
+    'new zealand': 'Wellington',
+    'czech republic': 'Prague',
+    'portugal': 'Lisbon',
+    'romania': 'Bucharest',
+    'vietnam': 'Hanoi',
+    'bangladesh': 'Dhaka',
+    'hungary': 'Budapest',
+    'ukraine': 'Kyiv',
+    'morocco': 'Rabat',
+    'slovakia': 'Bratislava',
+    'bulgaria': 'Sofia',
+    'croatia': 'Zagreb',
+    'tunisia': 'Tunis',
+    'lithuania': 'Vilnius',
+    'slovenia': 'Ljubljana',
+    'latvia': 'Riga',
+    'estonia': 'Tallinn',
+    'cyprus': 'Nicosia',
+    'luxembourg': 'Luxembourg',
+    'malta': 'Valletta',
+    'iceland': 'Reykjavík'
+}
 
 
+@lru_cache(maxsize=256)
 def get_capital_city(country_name):
+    # Common case: one hash lookup against the static table
+    capital = _CAPITAL_MAP.get(country_name.lower())
+    if capital:
+        return capital
+    # Unknown name: fall back to restcountries; lru_cache keeps repeat
+    # lookups off the network within a process
     try:
-        resp = requests.get(f'https://restcountries.com/v3.1/name/{country_name}', timeout=5)
+        resp = _SESSION.get(f'https://restcountries.com/v3.1/name/{country_name}', timeout=(1.5, 4))
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             country_code = get_country_code(country_name)
             # Try to find an exact match for the country name or code
             for country in data:
@@ -505,4 +768,24 @@ def get_capital_city(country_name):
                     return country['capital'][0]
     except Exception as e:
         print(f'Error fetching capital for {country_name}: {e}')
-    return country_name  # fallback 
\ No newline at end of file
+    return country_name  # fallback 
+
+def _warm_worldbank_cache():
+    """Pre-populate the shared session cache for the common endpoints.
+
+    Runs on a daemon thread so import returns immediately; by the time the
+    first user action fires, the snapshot and sector projections are
+    already sitting in the requests-cache sqlite file (or at least the
+    session's keep-alive connection is open).
+    """
+    try:
+        fetch_all_india_stats()
+    except Exception:
+        pass
+
+
+# Opt-in (WARMUP_WORLDBANK=1) so plain imports and offline runs stay cheap
+if os.environ.get("WARMUP_WORLDBANK") == "1" and not _OFFLINE:
+    threading.Thread(
+        target=_warm_worldbank_cache, daemon=True, name="worldbank-warmup"
+    ).start()